@@ -1,107 +1,437 @@
 from collections import deque
+import ctypes
+import glob
+import os
+import queue
 import threading
 import time
+import numpy as np
 import psutil
 import random
-from typing import List, Dict, NamedTuple
+from typing import List, Dict, NamedTuple, Optional
 from datetime import datetime
 
+CACHE_LINE_SIZE = 64
+LOCAL_QUEUE_CAPACITY = 256  # power of two so ring slots are found with a mask
+LOAD_HISTORY_SIZE = 128  # power of two so the head index wraps with a mask
+RNG_BATCH_SIZE = 4096
+MIN_PROJECTED_TASK_TIME = 1e-3  # seconds; floor for batch placement
+INITIAL_TASK_CAPACITY = 1024  # rows; the task table doubles when full
+NO_REQUEST = -1
+NO_RESPONSE = object()
+
+def compute_weight(load, spec_factor, cpu, temp):
+    # Lower is better: specialized processors get a 30% discount (spec_factor
+    # 0.7), hot or busy ones are penalized. Works on scalars and on arrays.
+    return load * spec_factor * (1 + cpu / 200) * (1 + (temp - 40) / 100)
+
+def _core_for(worker_id: int) -> int:
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    return cpus[worker_id % len(cpus)]
+
+def _pin_to_core(worker_id: int):
+    # Keep each worker on its own core so its deque stays in that core's
+    # cache. Pins the calling thread (or process). Not every platform
+    # supports affinity; run unpinned there.
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    os.sched_setaffinity(0, {_core_for(worker_id)})
+
+def _parse_cpulist(text: str) -> List[int]:
+    # sysfs cpulist format, e.g. "0-3,8-11"
+    cpus = []
+    for part in text.strip().split(","):
+        if part:
+            first, _, last = part.partition("-")
+            cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+def _numa_topology() -> Dict[int, int]:
+    # Map each CPU to its NUMA node. Only Linux exposes this (in sysfs);
+    # anywhere else every CPU is treated as node 0.
+    topology = {}
+    for path in glob.glob("/sys/devices/system/node/node[0-9]*/cpulist"):
+        node = int(os.path.basename(os.path.dirname(path))[len("node"):])
+        try:
+            with open(path) as f:
+                cpus = _parse_cpulist(f.read())
+        except OSError:
+            continue
+        for cpu in cpus:
+            topology[cpu] = node
+    return topology
+
+class AsyncLogger:
+    """Prints log lines from a background thread.
+
+    Hot paths only enqueue a format string and its arguments; formatting and
+    the stdout write happen on the logger thread, so workers never contend
+    for the stdout lock.
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def log(self, fmt: str, *args):
+        if self._thread is None:
+            self._start()
+        self._queue.put((fmt, args))
+
+    def flush(self, timeout: float = None):
+        # Block until everything logged so far has been printed.
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, name="logger", daemon=True)
+                self._thread.start()
+
+    def _drain(self):
+        while True:
+            item = self._queue.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            fmt, args = item
+            print(fmt.format(*args))
+
+logger = AsyncLogger()
+
 class TaskType(NamedTuple):
     name: str
     cpu_intensity: float    # 0-1
     memory_requirement: int # MB
     io_intensity: float    # 0-1
 
-class Task(NamedTuple):
-    id: str
-    priority: int
-    execution_time: float
-    arrival_time: float
-    task_type: TaskType
-    status: str = "pending"
+# Tasks are rows of DynamicLoadBalancer's task table; queues carry row indices.
+TASK_DTYPE = np.dtype([
+    ("priority", "i4"),
+    ("execution_time", "f4"),
+    ("arrival_time", "f4"),
+    ("type_id", "u1"),
+])
+
+class WorkStealingDeque:
+    """Bounded ring-buffer deque private to one processor's worker.
+
+    The owner pushes and pops at the bottom (newest first) and hands its
+    oldest task to other processors with steal() from the top. Thieves never
+    touch the deque: they post a request and the owner answers it (see
+    ProcessorQueue.process_task_requests), so no locking is needed. Other
+    threads only read len() for load reporting.
+    """
+
+    def __init__(self, capacity: int = LOCAL_QUEUE_CAPACITY):
+        assert capacity & (capacity - 1) == 0, "capacity must be a power of two"
+        self._buffer = [None] * capacity
+        self._mask = capacity - 1
+        self._top = 0
+        self._bottom = 0
+
+    def __len__(self):
+        return max(0, self._bottom - self._top)
+
+    def push(self, task) -> bool:
+        # Bounded: returns False instead of growing when the ring is full.
+        bottom = self._bottom
+        if bottom - self._top > self._mask:
+            return False
+        self._buffer[bottom & self._mask] = task
+        self._bottom = bottom + 1
+        return True
+
+    def pop(self):
+        if self._bottom == self._top:
+            return None
+        self._bottom -= 1
+        return self._take(self._bottom)
+
+    def steal(self):
+        if self._bottom == self._top:
+            return None
+        self._top += 1
+        return self._take(self._top - 1)
+
+    def _take(self, index: int):
+        # Drop the ring's reference so finished tasks are freed right away
+        slot = index & self._mask
+        task = self._buffer[slot]
+        self._buffer[slot] = None
+        return task
+
+class _PaddedCounters(ctypes.Structure):
+    _fields_ = [
+        ("tasks_processed", ctypes.c_uint64),
+        ("successful_tasks", ctypes.c_uint64),
+        ("failed_tasks", ctypes.c_uint64),
+        ("execution_time", ctypes.c_double),
+        ("_pad", ctypes.c_ubyte * (CACHE_LINE_SIZE - 32)),
+    ]
+
+def _allocate_counters(count: int):
+    # One cache line per processor, with the array itself line-aligned so
+    # neighbouring processors never share a line.
+    raw = ctypes.create_string_buffer(CACHE_LINE_SIZE * (count + 1))
+    offset = -ctypes.addressof(raw) % CACHE_LINE_SIZE
+    return (_PaddedCounters * count).from_buffer(raw, offset)
+
+class _BatchedDraws:
+    """Hands out random numbers drawn in bulk by a single NumPy call."""
+
+    def __init__(self, draw, size: int = RNG_BATCH_SIZE):
+        self._draw = draw
+        self._size = size
+        self._values = draw(size).tolist()
+        self._index = 0
+
+    def next_value(self) -> float:
+        i = self._index
+        if i >= self._size:
+            self._values = self._draw(self._size).tolist()
+            i = 0
+        self._index = i + 1
+        return self._values[i]
 
 class ProcessorMetrics:
     def __init__(self):
         self.cpu_usage = 0.0
         self.memory_usage = 0.0
         self.io_usage = 0.0
-        self.temperature = 0.0
+        self.temperature = 40.0  # idle temperature, as update_metrics computes it
         self.power_consumption = 0.0
 
 class ProcessorQueue:
-    def __init__(self, processor_id: int, specialization: List[str] = None):
+    def __init__(self, processor_id: int, specialization: Optional[List[str]],
+                 balancer: "DynamicLoadBalancer", capacity: float = 100.0,
+                 counters: "_PaddedCounters" = None):
         self.processor_id = processor_id
-        self.tasks = deque()
-        self.lock = threading.Lock()
+        # Hot counters live on their own cache line; only this processor's
+        # worker writes them, so plain increments are safe.
+        self._counters = counters if counters is not None else _PaddedCounters()
+        self._capacity = capacity
+        self.balancer = balancer
+        # Private deque: only this processor's worker touches it. Submissions
+        # from other threads land in the inbox and are drained by the worker.
+        self.tasks = WorkStealingDeque()
+        self.inbox = deque()
+        # Set when another processor needs this worker's attention
+        self._wakeup = threading.Event()
+        self.idle = False
+        self._idle_backoff = balancer.idle_poll_interval
+        # Newest task, run next and never handed to another processor, so
+        # its data is still warm in this core's cache when it starts.
+        self.lifo_slot: Optional[int] = None
         self.load = 0.0
-        self.total_tasks_processed = 0
-        self.total_execution_time = 0.0
         self.specialization = specialization or []
         self.metrics = ProcessorMetrics()
-        self.failed_tasks = 0
-        self.successful_tasks = 0
-        self.load_history = []  # Store load history for graphing
+        # Per task type id; specialized types never fail
+        self._success_chance = [1.0 if name in self.specialization else 0.95
+                                for name in balancer.task_types]
+        rng = np.random.default_rng()
+        self._memory_draws = _BatchedDraws(lambda n: rng.uniform(20, 80, n))
+        self._success_draws = _BatchedDraws(rng.random)
+        # Ring buffer of recent loads for graphing; read it via get_history()
+        self.load_history = np.zeros(LOAD_HISTORY_SIZE, dtype=np.float32)
+        self._hist_head = 0
+        self._hist_count = 0
+
+    @property
+    def total_tasks_processed(self) -> int:
+        return self._counters.tasks_processed
+
+    @property
+    def total_execution_time(self) -> float:
+        return self._counters.execution_time
+
+    @property
+    def successful_tasks(self) -> int:
+        return self._counters.successful_tasks
+
+    @property
+    def failed_tasks(self) -> int:
+        return self._counters.failed_tasks
+
+    def pending_tasks(self) -> int:
+        return len(self.tasks) + len(self.inbox) + (self.lifo_slot is not None)
 
     def update_metrics(self):
-        self.metrics.cpu_usage = min(100, len(self.tasks) * 20)
-        self.metrics.memory_usage = random.uniform(20, 80)
+        self.metrics.cpu_usage = min(100, self.pending_tasks() * 20)
+        self.metrics.memory_usage = self._memory_draws.next_value()
         self.metrics.temperature = 40 + (self.metrics.cpu_usage / 2)
         self.metrics.power_consumption = self.metrics.cpu_usage * 2
+        self.balancer._cpu[self.processor_id] = self.metrics.cpu_usage
+        self.balancer._temp[self.processor_id] = self.metrics.temperature
 
-    def add_task(self, task):
-        with self.lock:
-            self.tasks.append(task)
-            self.update_load()
-            self.update_metrics()
-            print(f"Processor {self.processor_id}: Added {task.id} "
-                  f"(Priority: {task.priority}, Type: {task.task_type.name}, "
-                  f"Load: {self.load:.2f}%, Temp: {self.metrics.temperature:.1f}°C)")
-            self._simulate_task_execution(task)
-
-
-    def _simulate_task_execution(self, task):
-        self.total_tasks_processed += 1
-        self.total_execution_time += task.execution_time
-        threading.Thread(target=self._execute_task, args=(task,), daemon=True).start()
-
-    def _execute_task(self, task):
-        success_chance = 0.95
-        if task.task_type.name in self.specialization:
-            success_chance += 0.05
-
-        time.sleep(task.execution_time)
-        with self.lock:
-            if task in self.tasks:
-                self.tasks.remove(task)
-                if random.random() < success_chance:
-                    self.successful_tasks += 1
-                    status = "completed"
-                else:
-                    self.failed_tasks += 1
-                    status = "failed"
-                
-                self.update_load()
-                self.update_metrics()
-                print(f"Processor {self.processor_id}: Task {task.id} {status} "
-                      f"(New Load: {self.load:.2f}%, CPU: {self.metrics.cpu_usage:.1f}%)")
+    def add_task(self, task: int):
+        self.inbox.append(task)
+        if self.idle:
+            self._wakeup.set()
+        self.update_load()
+        self.update_metrics()
+        lb = self.balancer
+        row = lb._tasks_soa[task]
+        logger.log("Processor {}: Added {} (Priority: {}, Type: {}, Load: {:.2f}%, Temp: {:.1f}°C)",
+                   self.processor_id, lb._task_ids[task], row["priority"],
+                   lb._type_names[row["type_id"]], self.load, self.metrics.temperature)
+
+    def run(self):
+        _pin_to_core(self.processor_id)
+        # Worker loop: run local work, otherwise ask a busy processor for
+        # some, and answer pending requests between tasks.
+        while not self.balancer.terminated:
+            task = self.get_task()
+            if task is None:
+                task = self.balancer.take_injected()
+            if task is None:
+                task = self.acquire_task()
+            if task is None:
+                continue
+            self.idle = False
+            self._idle_backoff = self.balancer.idle_poll_interval
+            self._execute_task(task)
+            self.process_task_requests()
+
+    def _execute_task(self, task: int):
+        lb = self.balancer
+        _, execution_time, _, type_id = lb._tasks_soa[task].item()
+        success_chance = self._success_chance[type_id]
+
+        # Rather than sleeping through the task, wait until its deadline on
+        # the wake-up event so steal requests are answered mid-task.
+        deadline = time.monotonic() + execution_time
+        remaining = execution_time
+        while remaining > 0:
+            self._wakeup.wait(remaining)
+            self._wakeup.clear()
+            self.process_task_requests()
+            remaining = deadline - time.monotonic()
+        counters = self._counters
+        counters.tasks_processed += 1
+        counters.execution_time += execution_time
+        if self._success_draws.next_value() < success_chance:
+            counters.successful_tasks += 1
+            status = "completed"
+        else:
+            counters.failed_tasks += 1
+            status = "failed"
+
+        self.update_load()
+        self.update_metrics()
+        logger.log("Processor {}: Task {} {} (New Load: {:.2f}%, CPU: {:.1f}%)",
+                   self.processor_id, lb._task_ids[task], status, self.load, self.metrics.cpu_usage)
+
+    def _drain_inbox(self):
+        while self.inbox:
+            task = self.inbox.popleft()
+            if self.lifo_slot is not None and not self.tasks.push(self.lifo_slot):
+                # Local ring is full: overflow to the shared injector queue
+                self.balancer.injector.append(self.lifo_slot)
+                self.balancer.wake_idle_processors(self.processor_id)
+            self.lifo_slot = task
 
     def get_task(self):
-        with self.lock:
-            if self.tasks:
-                task = self.tasks.popleft()
-                self.update_load()
-                return task
+        self._drain_inbox()
+        task, self.lifo_slot = self.lifo_slot, None
+        if task is None:
+            task = self.tasks.pop()
+        self._publish_work()
+        if task is not None:
+            self.update_load()
+        return task
+
+    def _publish_work(self):
+        lb = self.balancer
+        available = len(self.tasks) > 0
+        was_available = lb.work_available[self.processor_id]
+        lb.work_available[self.processor_id] = available
+        if available and not was_available:
+            # Newly stealable work: wake the backed-off idle processors for it
+            lb.wake_idle_processors(self.processor_id)
+
+    def process_task_requests(self):
+        lb = self.balancer
+        requester = lb.requests[self.processor_id]
+        if requester == NO_REQUEST:
+            return
+        # Hand over the oldest task; None tells the requester to look elsewhere.
+        # The LIFO slot is never given away.
+        self._drain_inbox()
+        task = self.tasks.steal()
+        self._publish_work()
+        lb.transfers[requester] = task
+        lb.requests[self.processor_id] = NO_REQUEST
+        lb.processor_queues[requester]._wakeup.set()
+        if task is not None:
+            self.update_load()
+            logger.log("Processor {}: Transferred {} to Processor {}",
+                       self.processor_id, lb._task_ids[task], requester)
+
+    def acquire_task(self):
+        lb = self.balancer
+        pid = self.processor_id
+        # Mark ourselves idle before looking for work, so anything that
+        # shows up after the search also sets our wake-up event.
+        self.idle = True
+        lb.work_available[pid] = False
+        lb.transfers[pid] = NO_RESPONSE
+        victims = [k for k, busy in enumerate(lb.work_available) if busy and k != pid]
+        # Steal within our NUMA node when we can; a task moved across nodes
+        # pays remote-memory latency on every access to its data.
+        local = [k for k in victims if lb.numa_nodes[k] == lb.numa_nodes[pid]]
+        if not victims:
+            self.process_task_requests()
+            # Answering a request drains the inbox, so check everything we hold
+            if self.pending_tasks() or lb.injector:
+                return None
+            # Back off exponentially while there is nothing to do; new work
+            # cuts the wait short through the wake-up event.
+            self._wakeup.wait(self._idle_backoff)
+            self._wakeup.clear()
+            self._idle_backoff = min(self._idle_backoff * 1.5, lb.max_idle_backoff)
             return None
+        if not lb.post_request(random.choice(local or victims), pid):
+            # Work exists but another thief holds the victim's request slot:
+            # retry soon rather than backing off.
+            self.process_task_requests()
+            self._wakeup.wait(lb.idle_poll_interval)
+            self._wakeup.clear()
+            return None
+        while lb.transfers[pid] is NO_RESPONSE:
+            if lb.terminated:
+                return None
+            # Decline anyone asking us while we wait, or two idle
+            # processors could end up waiting on each other. The victim
+            # sets our wake-up event once it has answered.
+            self._wakeup.wait(lb.idle_poll_interval)
+            self._wakeup.clear()
+            self.process_task_requests()
+        return lb.transfers[pid]
 
     def update_load(self):
-        self.load = len(self.tasks) * 100 / self.get_processor_capacity()
-        # Append current load to history, keep last 100 entries
-        self.load_history.append(self.load)
-        if len(self.load_history) > 100:
-            self.load_history.pop(0)
+        self.load = self.pending_tasks() * 100 / self.get_processor_capacity()
+        self.balancer._loads[self.processor_id] = self.load
+        self.load_history[self._hist_head] = self.load
+        self._hist_head = (self._hist_head + 1) & (LOAD_HISTORY_SIZE - 1)
+        self._hist_count = min(self._hist_count + 1, LOAD_HISTORY_SIZE)
+
+    def get_history(self) -> np.ndarray:
+        # Oldest first
+        if self._hist_count < LOAD_HISTORY_SIZE:
+            return self.load_history[:self._hist_count].copy()
+        return np.roll(self.load_history, -self._hist_head)
 
     def get_processor_capacity(self):
-        return psutil.cpu_freq().current or 100.0
+        return self._capacity
 
 class DynamicLoadBalancer:
     def __init__(self, num_processors: int):
@@ -111,16 +441,6 @@ class DynamicLoadBalancer:
             ["io_intensive"],
             []
         ]
-        
-        self.processor_queues = [
-            ProcessorQueue(i, specializations[i % len(specializations)])
-            for i in range(num_processors)
-        ]
-        
-        self.load_threshold = 70.0
-        self.monitoring_interval = 1.0
-        self.start_time = time.time()
-        self.tasks_submitted = 0
         self.task_types = {
             "compute_intensive": TaskType("compute_intensive", 0.9, 200, 0.1),
             "memory_intensive": TaskType("memory_intensive", 0.3, 800, 0.2),
@@ -128,34 +448,134 @@ class DynamicLoadBalancer:
             "balanced": TaskType("balanced", 0.5, 400, 0.5)
         }
 
+        # Idle workers start polling at idle_poll_interval and back off
+        # up to max_idle_backoff seconds
+        self.idle_poll_interval = 0.01
+        self.max_idle_backoff = 5.0
+
+        # Reading the CPU frequency is a syscall (or worse), so do it once
+        # here rather than on every load update.
+        freq = psutil.cpu_freq()
+        self._capacity = (freq.current if freq else 0.0) or 100.0
+        self._counters = _allocate_counters(num_processors)
+        self.processor_queues = [
+            ProcessorQueue(i, specializations[i % len(specializations)], self, self._capacity,
+                           self._counters[i])
+            for i in range(num_processors)
+        ]
+
+        # Struct-of-arrays mirror of the per-processor fields used for
+        # placement, kept current by ProcessorQueue.update_load/update_metrics.
+        self._loads = np.zeros(num_processors)
+        self._cpu = np.zeros(num_processors)
+        self._temp = np.full(num_processors, 40.0)
+        self._type_names = list(self.task_types)
+        self._type_index = {name: i for i, name in enumerate(self._type_names)}
+        # Specialization resolved once per task type: row t holds every
+        # processor's weight factor for type t, so placement never compares
+        # type names against specialization lists.
+        self._spec_factor = np.array([
+            [0.7 if name in p.specialization else 1.0 for p in self.processor_queues]
+            for name in self._type_names
+        ])
+
+        # Receiver-initiated work stealing: idle processors post their id in
+        # a busy processor's requests slot and wait for the task it places
+        # in their transfers slot.
+        self.work_available = [False] * num_processors
+        self.requests = [NO_REQUEST] * num_processors
+        self.transfers = [NO_RESPONSE] * num_processors
+        self._request_lock = threading.Lock()
+        # Overflow from full local deques, drained by idle processors
+        self.injector = deque()
+        self.terminated = False
+        topology = _numa_topology()
+        self.numa_nodes = [topology.get(_core_for(i), 0) for i in range(num_processors)]
+        self.start_time = time.monotonic()
+        self.tasks_submitted = 0
+        self._tasks_soa = np.zeros(INITIAL_TASK_CAPACITY, dtype=TASK_DTYPE)
+        self._task_ids: List[str] = []
+        self._submit_lock = threading.Lock()
+
+        # One long-lived worker per processor; tasks never get their own thread.
+        self.workers = [
+            threading.Thread(target=p.run, name=f"processor-{p.processor_id}", daemon=True)
+            for p in self.processor_queues
+        ]
+        for worker in self.workers:
+            worker.start()
+
     def submit_task(self, task_id: str, priority: int = 1, execution_time: float = 0.5, task_type: str = "balanced") -> bool:
-        self.tasks_submitted += 1
-        task = Task(
-            id=task_id,
-            priority=priority,
-            execution_time=execution_time,
-            arrival_time=time.time() - self.start_time,
-            task_type=self.task_types[task_type]
-        )
-        target_processor = self._find_optimal_processor(task)
+        type_id = self._type_index[task_type]
+        task = self._register_task(task_id, priority, execution_time, type_id)
+        target_processor = self._find_optimal_processor(type_id)
         target_processor.add_task(task)
         return True
 
-    def _find_optimal_processor(self, task) -> ProcessorQueue:
-        weighted_loads = []
-        for p in self.processor_queues:
-            weight = p.load
-            if task.task_type.name in p.specialization:
-                weight *= 0.7
-            weight *= (1 + p.metrics.cpu_usage / 200)
-            weight *= (1 + (p.metrics.temperature - 40) / 100)
-            weighted_loads.append((p, weight))
-        return min(weighted_loads, key=lambda x: x[1])[0]
+    def submit_tasks(self, tasks: List[tuple]) -> int:
+        """Submit a batch of (task_id, priority, execution_time, task_type) tuples.
+
+        The whole batch is scored against every processor in one broadcast,
+        then placed longest-processing-time first: each task goes to the
+        processor with the lowest projected weight, which then grows by the
+        task's share. Returns the number of tasks submitted.
+        """
+        if not tasks:
+            return 0
+        type_ids = np.array([self._type_index[task_type] for _, _, _, task_type in tasks])
+        exec_times = np.array([execution_time for _, _, execution_time, _ in tasks])
+        rows = [self._register_task(task_id, priority, execution_time, type_id)
+                for (task_id, priority, execution_time, _), type_id in zip(tasks, type_ids)]
+
+        # (tasks x processors) weight factors; projected backlog is in
+        # load-seconds, with already-queued tasks counted at the batch mean.
+        # Durations are floored so every placed task adds to the projection,
+        # including zero-length ones.
+        factors = compute_weight(1.0, self._spec_factor[type_ids], self._cpu, self._temp)
+        exec_times = np.maximum(exec_times, MIN_PROJECTED_TASK_TIME)
+        projected = self._loads * exec_times.mean()
+        per_task_load = 100 / self._capacity
+        for k in np.argsort(-exec_times, kind="stable"):
+            target = int(np.argmin(projected * factors[k]))
+            projected[target] += per_task_load * exec_times[k]
+            self.processor_queues[target].add_task(rows[k])
+        return len(tasks)
+
+    def _register_task(self, task_id: str, priority: int, execution_time: float, type_id: int) -> int:
+        # Claiming a row, growing the table and recording the id must happen
+        # together, or concurrent submitters could share a row.
+        with self._submit_lock:
+            task = len(self._task_ids)
+            if task == len(self._tasks_soa):
+                # Grow by doubling; rows already handed to processors are copied
+                grown = np.zeros(2 * len(self._tasks_soa), dtype=TASK_DTYPE)
+                grown[:task] = self._tasks_soa
+                self._tasks_soa = grown
+            self._tasks_soa[task] = (priority, execution_time, time.monotonic() - self.start_time, type_id)
+            self._task_ids.append(task_id)
+            self.tasks_submitted = task + 1
+        return task
+
+    def _find_optimal_processor(self, type_index: int) -> ProcessorQueue:
+        # Power of two choices: compare two random processors instead of
+        # scanning all of them; keeps the max load within O(log log P) of
+        # optimal at O(1) cost per submission.
+        count = len(self.processor_queues)
+        if count < 2:
+            return self.processor_queues[0]
+        a, b = random.sample(range(count), 2)
+        if self._weight(a, type_index) <= self._weight(b, type_index):
+            return self.processor_queues[a]
+        return self.processor_queues[b]
+
+    def _weight(self, processor_id: int, type_index: int) -> float:
+        return compute_weight(self._loads[processor_id], self._spec_factor[type_index, processor_id],
+                              self._cpu[processor_id], self._temp[processor_id])
 
     def get_statistics(self) -> Dict:
         return {
             "total_tasks": self.tasks_submitted,
-            "runtime": time.time() - self.start_time,
+            "runtime": time.monotonic() - self.start_time,
             "processors": [{
                 "id": p.processor_id,
                 "specialization": p.specialization,
@@ -168,49 +588,51 @@ class DynamicLoadBalancer:
             } for p in self.processor_queues]
         }
 
-    def balance_load(self):
-        while True:
-            time.sleep(self.monitoring_interval)
-            self._perform_load_balancing()
-
-    def _perform_load_balancing(self):
-        processors = sorted(self.processor_queues, key=lambda x: x.load)
-        most_loaded = processors[-1]
-        least_loaded = processors[0]
-
-        if most_loaded.load - least_loaded.load > self.load_threshold:
-            tasks_to_move = len(most_loaded.tasks) // 2
-            print(f"\nRebalancing: Moving {tasks_to_move} tasks from Processor {most_loaded.processor_id} to Processor {least_loaded.processor_id}")
-            print(f"Before - P{most_loaded.processor_id}: {most_loaded.load:.2f}%, P{least_loaded.processor_id}: {least_loaded.load:.2f}%")
-            
-            for _ in range(tasks_to_move):
-                task = most_loaded.get_task()
-                if task:
-                    least_loaded.add_task(task)
-            
-            print(f"After  - P{most_loaded.processor_id}: {most_loaded.load:.2f}%, P{least_loaded.processor_id}: {least_loaded.load:.2f}%\n")
-
-    def start_monitoring(self):
-        monitor_thread = threading.Thread(target=self.balance_load, daemon=True)
-        monitor_thread.start()
+    def post_request(self, victim: int, requester: int) -> bool:
+        with self._request_lock:
+            if self.requests[victim] != NO_REQUEST:
+                return False
+            self.requests[victim] = requester
+        self.processor_queues[victim]._wakeup.set()
+        return True
+
+    def take_injected(self) -> Optional[int]:
+        try:
+            return self.injector.popleft()
+        except IndexError:
+            return None
+
+    def wake_idle_processors(self, caller: int):
+        # Wake every idle processor but the caller; a single wake-up could
+        # land on one that is not backing off and be lost.
+        for p in self.processor_queues:
+            if p.idle and p.processor_id != caller:
+                p._wakeup.set()
+
+    def shutdown(self):
+        self.terminated = True
+        for p in self.processor_queues:
+            p._wakeup.set()
 
 def main():
     num_processors = psutil.cpu_count()
     print(f"Starting load balancer with {num_processors} processors")
     print("=" * 50)
     load_balancer = DynamicLoadBalancer(num_processors)
-    load_balancer.start_monitoring()
 
     task_types = ["compute_intensive", "memory_intensive", "io_intensive", "balanced"]
-    for i in range(100):
-        priority = i % 3 + 1
-        execution_time = 0.2 + (i % 5) * 0.1
-        task_type = task_types[i % len(task_types)]
-        task = f"Task_{i}"
-        load_balancer.submit_task(task, priority, execution_time, task_type)
-        time.sleep(0.1)
+    load_balancer.submit_tasks([
+        (f"Task_{i}", i % 3 + 1, 0.2 + (i % 5) * 0.1, task_types[i % len(task_types)])
+        for i in range(100)
+    ])
 
-    time.sleep(5)  # Allow time for remaining tasks to complete
+    # Wait for every task to complete (giving up after a timeout)
+    deadline = time.monotonic() + 120
+    while (sum(p.total_tasks_processed for p in load_balancer.processor_queues)
+           < load_balancer.tasks_submitted and time.monotonic() < deadline):
+        time.sleep(0.1)
+    load_balancer.shutdown()
+    logger.flush()
     # Print final statistics with enhanced metrics
     stats = load_balancer.get_statistics()
     print("\nEnhanced Final Statistics:")
@@ -2,8 +2,9 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import random
-import math
+import numpy as np
+
+HISTORY_LENGTH = 100
 
 class SimpleLoadBalancerGUI:
     def __init__(self, root):
@@ -14,6 +15,7 @@ class SimpleLoadBalancerGUI:
         self.selected_processor_id = tk.IntVar(value=0)
         self.updating = True
         self.time_step = 0
+        self._rng = np.random.default_rng()
 
         # Number of processors input
         ttk.Label(root, text="Number of Processors:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
@@ -40,13 +42,16 @@ class SimpleLoadBalancerGUI:
         self.ax.set_title("Processor Load Over Time")
         self.ax.set_xlabel("Time (most recent)")
         self.ax.set_ylabel("Load (%)")
-        self.line, = self.ax.plot([], [], 'b-')
+        # Animated so full redraws leave it out of the cached background
+        self.line, = self.ax.plot([], [], 'b-', animated=True)
         self.ax.set_ylim(0, 100)
         self.ax.set_xlim(0, 100)
         self.ax.grid(True)
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=root)
         self.canvas.get_tk_widget().grid(row=2, column=0, columnspan=3, sticky="nsew", padx=5, pady=5)
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
 
         # Text box for processor stats
         ttk.Label(root, text="Processor Statistics:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
@@ -59,8 +64,9 @@ class SimpleLoadBalancerGUI:
         root.grid_columnconfigure(1, weight=1)
         root.grid_columnconfigure(2, weight=1)
 
-        # Initialize artificial load data
-        self.load_data = {i: [] for i in range(self.num_processors)}
+        # Initialize artificial load data: one ring buffer row per processor,
+        # column time_step % HISTORY_LENGTH is the newest sample
+        self.load_data = np.zeros((self.num_processors, HISTORY_LENGTH))
 
         # Start periodic update
         self.update_gui()
@@ -77,7 +83,7 @@ class SimpleLoadBalancerGUI:
             self.processor_combo['values'] = list(range(self.num_processors))
             self.processor_combo.current(0)
             self.selected_processor_id.set(0)
-            self.load_data = {i: [] for i in range(self.num_processors)}
+            self.load_data = np.zeros((self.num_processors, HISTORY_LENGTH))
             self.time_step = 0
             self.update_gui()
         except ValueError:
@@ -96,12 +102,12 @@ class SimpleLoadBalancerGUI:
         else:
             self.pause_button.config(text="Resume Updates")
 
-    def generate_artificial_load(self, proc_id):
-        # Generate artificial load data using sine wave + random noise
-        base = 50 + 30 * math.sin(0.1 * self.time_step + proc_id)
-        noise = random.uniform(-10, 10)
-        load = max(0, min(100, base + noise))
-        return load
+    def generate_artificial_load(self):
+        # Generate artificial load data for all processors at once using sine wave + random noise
+        ids = np.arange(self.num_processors)
+        base = 50 + 30 * np.sin(0.1 * self.time_step + ids)
+        noise = self._rng.uniform(-10, 10, self.num_processors)
+        return np.clip(base + noise, 0, 100)
 
     def update_gui(self):
         if not self.updating:
@@ -110,20 +116,16 @@ class SimpleLoadBalancerGUI:
         proc_id = self.selected_processor_id.get()
 
         # Update artificial load data
-        load = self.generate_artificial_load(proc_id)
-        data = self.load_data[proc_id]
-        data.append(load)
-        if len(data) > 100:
-            data.pop(0)
+        self.load_data[:, self.time_step % HISTORY_LENGTH] = self.generate_artificial_load()
+        load = float(self.load_data[proc_id, self.time_step % HISTORY_LENGTH])
 
         self.time_step += 1
 
-        # Update load line chart
-        xdata = list(range(len(data)))
-        ydata = data
+        # Update load line chart, oldest sample first
+        count = min(self.time_step, HISTORY_LENGTH)
+        ydata = np.roll(self.load_data[proc_id], -(self.time_step % HISTORY_LENGTH))[-count:]
+        xdata = np.arange(count)
         self.line.set_data(xdata, ydata)
-        self.ax.set_xlim(0, max(100, len(data)))
-        self.ax.set_ylim(0, 100)
 
         # Update processor stats text with artificial data
         success = int(load * 0.8)
@@ -149,11 +151,23 @@ class SimpleLoadBalancerGUI:
         self.stats_text.insert(tk.END, text)
         self.stats_text.config(state='disabled')
 
-        self.canvas.draw()
+        # Blit only the line over the cached axes background
+        if self._background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            self.ax.draw_artist(self.line)
+            self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
 
         # Schedule next update
         self.root.after(1000, self.update_gui)
 
+    def on_draw(self, event):
+        # Full redraws (first show, window resize) refresh the cached background
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+
     def on_quit(self):
         self.updating = False
 